@@ -5,7 +5,7 @@ This module encapsulates all OpenAI-specific logic that was previously in chat_a
 import json
 import time
 import httpx
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Optional
 
 from fastapi.responses import JSONResponse, StreamingResponse
 import openai
@@ -21,6 +21,26 @@ from api_helpers import (
 from message_processing import extract_reasoning_by_tags
 from credentials_manager import _refresh_auth
 from project_id_discovery import discover_project_id
+from proxy_utils import is_socks_proxy_url
+
+
+def _get_httpx_proxies(proxy_url: Optional[str]) -> Optional[Dict[str, str]]:
+    """Map a proxy URL to an httpx proxies mapping (SOCKS proxies cover all traffic)."""
+    if not proxy_url:
+        return None
+    if is_socks_proxy_url(proxy_url):
+        return {"all://": proxy_url}
+    return {"https://": proxy_url}
+
+
+def _get_httpx_client_args(**client_args: Any) -> Dict[str, Any]:
+    """Build httpx.AsyncClient kwargs, adding proxy and SSL settings from config."""
+    proxies = _get_httpx_proxies(app_config.PROXY_URL)
+    if proxies:
+        client_args['proxies'] = proxies
+    if app_config.SSL_CERT_FILE:
+        client_args['verify'] = app_config.SSL_CERT_FILE
+    return client_args
 
 
 # Wrapper classes to mimic OpenAI SDK responses for direct httpx calls
@@ -80,18 +100,7 @@ class ExpressClientWrapper:
         if 'extra_body' in payload:
             payload.update(payload.pop('extra_body'))
 
-        proxies = None
-        if app_config.PROXY_URL:
-            if app_config.PROXY_URL.startswith("socks"):
-                proxies = {"all://": app_config.PROXY_URL}
-            else:
-                proxies = {"https://": app_config.PROXY_URL}
-
-        client_args = {'timeout': 300}
-        if proxies:
-            client_args['proxies'] = proxies
-        if app_config.SSL_CERT_FILE:
-            client_args['verify'] = app_config.SSL_CERT_FILE
+        client_args = _get_httpx_client_args(timeout=300)
         async with httpx.AsyncClient(**client_args) as client:
             async with client.stream("POST", endpoint, headers=headers, params=params, json=payload, timeout=None) as response:
                 response.raise_for_status()
@@ -118,18 +127,7 @@ class ExpressClientWrapper:
         if 'extra_body' in payload:
             payload.update(payload.pop('extra_body'))
 
-        proxies = None
-        if app_config.PROXY_URL:
-            if app_config.PROXY_URL.startswith("socks"):
-                proxies = {"all://": app_config.PROXY_URL}
-            else:
-                proxies = {"https://": app_config.PROXY_URL}
-
-        client_args = {'timeout': 300}
-        if proxies:
-            client_args['proxies'] = proxies
-        if app_config.SSL_CERT_FILE:
-            client_args['verify'] = app_config.SSL_CERT_FILE
+        client_args = _get_httpx_client_args(timeout=300)
         async with httpx.AsyncClient(**client_args) as client:
             response = await client.post(endpoint, headers=headers, params=params, json=payload, timeout=None)
             response.raise_for_status()
@@ -164,19 +162,7 @@ class OpenAIDirectHandler:
             f"projects/{project_id}/locations/{location}/endpoints/openapi"
         )
         
-        proxies = None
-        if app_config.PROXY_URL:
-            if app_config.PROXY_URL.startswith("socks"):
-                proxies = {"all://": app_config.PROXY_URL}
-            else:
-                proxies = {"https://": app_config.PROXY_URL}
-
-        client_args = {}
-        if proxies:
-            client_args['proxies'] = proxies
-        if app_config.SSL_CERT_FILE:
-            client_args['verify'] = app_config.SSL_CERT_FILE
-        
+        client_args = _get_httpx_client_args()
         http_client = httpx.AsyncClient(**client_args) if client_args else None
         return openai.AsyncOpenAI(
             base_url=endpoint_url,
@@ -0,0 +1,15 @@
+from typing import Optional
+from urllib.parse import urlsplit
+
+
+def is_socks_proxy_url(url: Optional[str]) -> bool:
+    """Return True if the given proxy URL uses a socks* scheme (socks5, socks5h, ...)."""
+    if not url:
+        return False
+    try:
+        scheme = urlsplit(url).scheme
+    except ValueError as e:
+        # Malformed URL (e.g. bad IPv6 host): fall back to a plain prefix check
+        print(f"WARNING: Could not parse proxy URL: {e}. Falling back to prefix check.")
+        scheme = url.lower()
+    return scheme.startswith("socks")
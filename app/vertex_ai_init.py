@@ -3,6 +3,7 @@ from typing import Optional
 from google import genai
 from credentials_manager import CredentialManager, parse_multiple_json_credentials
 import config as app_config
+from proxy_utils import is_socks_proxy_url
 from google.genai import types
 from model_loader import refresh_models_config_cache # Import new model loader function
 
@@ -14,7 +15,7 @@ from model_loader import refresh_models_config_cache # Import new model loader f
 
 def _get_http_options() -> Optional[types.HttpOptions]:
     """Get http options from config."""
-    if app_config.PROXY_URL and app_config.PROXY_URL.startswith("socks"):
+    if is_socks_proxy_url(app_config.PROXY_URL):
         return types.HttpOptions(
             client_args={'proxy': app_config.PROXY_URL},
             async_client_args={'proxy': app_config.PROXY_URL},